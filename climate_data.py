@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from scipy.interpolate import RegularGridInterpolator
+from scipy.spatial import Delaunay, cKDTree
+
+months_ordered = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+month_index = {m: i for i, m in enumerate(months_ordered)}
+metric_names = ["ghi", "tmin", "tmax", "tavg", "rh", "ws10m", "tdew", "ps"]
+
+@st.cache_resource
+def load_climate():
+    """
+    Load the sea grid climate data once per process and share it between pages.
+    Returns the DataFrame, a dict with one (N_locations, 12) matrix per metric
+    indexed [location, month] ("ghi" is polar corrected, "ghi_raw" is not), the
+    boolean polar mask (Antarctica and Greenland) and a KD-tree over (lat, lon).
+    The returned objects are shared by all sessions and must not be modified.
+    """
+    df = pd.read_parquet("climate_data_sea.parquet")
+    lat = df["lat"].values
+    lon = df["lon"].values
+
+    metrics = {
+        metric: np.stack([df[f"{metric}_{m}"].values for m in months_ordered], axis=1)
+        for metric in metric_names
+    }
+
+    # Halve GHI over Antarctica and Greenland for the maps; point calculations use ghi_raw
+    polar_mask = (lat < -65) | ((lat > 60) & (lon >= -60) & (lon <= -20))
+    metrics["ghi_raw"] = metrics["ghi"].copy()
+    metrics["ghi"][polar_mask, :] *= 0.5
+
+    # KD-tree over the grid points for nearest-location lookup
+    tree = cKDTree(df[["lat", "lon"]].values)
+    return df, metrics, polar_mask, tree
+
+@st.cache_resource
+def load_regular_grid():
+    """
+    Describe the climate points as the regular 2.5° lat/lon grid they lie on.
+    Returns a dict with the lat and lon axes, the grid (row, col) of every data point,
+    and for the few grid cells without data their (row, col) together with the
+    Delaunay vertices and barycentric weights that fill them by linear interpolation.
+    """
+    df, _, _, _ = load_climate()
+    lat = df["lat"].values
+    lon = df["lon"].values
+
+    lat_axis = np.unique(lat)
+    lon_axis = np.unique(lon)
+    rows = np.searchsorted(lat_axis, lat)
+    cols = np.searchsorted(lon_axis, lon)
+
+    has_data = np.zeros((len(lat_axis), len(lon_axis)), dtype=bool)
+    has_data[rows, cols] = True
+    hole_rows, hole_cols = np.nonzero(~has_data)
+
+    # Fill the holes the way griddata's linear method would
+    tri = Delaunay(np.c_[lon, lat])
+    holes = np.c_[lon_axis[hole_cols], lat_axis[hole_rows]]
+    simplex = tri.find_simplex(holes)
+    transform = tri.transform[simplex]
+    bary = np.einsum("ijk,ik->ij", transform[:, :2], holes - transform[:, 2])
+    hole_weights = np.c_[bary, 1 - bary.sum(axis=1)]
+    hole_weights[simplex < 0] = np.nan  # outside the convex hull
+
+    return {
+        "lat_axis": lat_axis,
+        "lon_axis": lon_axis,
+        "rows": rows,
+        "cols": cols,
+        "hole_rows": hole_rows,
+        "hole_cols": hole_cols,
+        "hole_vertices": tri.simplices[simplex],
+        "hole_weights": hole_weights,
+    }
+
+@st.cache_resource
+def load_mesh():
+    """
+    The 200 x 150 lon/lat mesh the maps are drawn on.
+    Returns lon_mesh, lat_mesh and the same points flattened to (M, 2) rows of (lat, lon).
+    """
+    df, _, _, _ = load_climate()
+    lat = df["lat"].values
+    lon = df["lon"].values
+
+    lon_grid = np.linspace(min(lon), max(lon), 200)
+    lat_grid = np.linspace(min(lat), max(lat), 150)
+    lon_mesh, lat_mesh = np.meshgrid(lon_grid, lat_grid)
+    mesh_points = np.column_stack([lat_mesh.ravel(), lon_mesh.ravel()])
+    return lon_mesh, lat_mesh, mesh_points
+
+def interpolate_to_mesh(data):
+    """Linearly interpolate per-location data from the regular climate grid onto the map mesh."""
+    grid = load_regular_grid()
+    lon_mesh, _, mesh_points = load_mesh()
+    values = np.full((len(grid["lat_axis"]), len(grid["lon_axis"])), np.nan)
+    values[grid["rows"], grid["cols"]] = data
+    values[grid["hole_rows"], grid["hole_cols"]] = (data[grid["hole_vertices"]] * grid["hole_weights"]).sum(axis=1)
+
+    interp = RegularGridInterpolator((grid["lat_axis"], grid["lon_axis"]), values,
+                                     method="linear", bounds_error=False)
+    return interp(mesh_points).reshape(lon_mesh.shape)
@@ -1,4 +1,5 @@
 import numpy as np
+from numba import njit
 from scipy.interpolate import interp1d
 
 # Saturation pressure table from Appendix D
@@ -17,14 +18,23 @@ def saturation_pressure(temp_c):
     """Returns saturation vapor pressure in Pa for a given temperature in °C."""
     return _sat_pressure_fn(temp_c)
 
-def compute_heat_losses(pool_temp, pool_area, pool_depth, T_day, T_night,
-                        wind_day, wind_night, rh_day, rh_night,
-                        night_hours, cover_used):
+@njit(cache=True, fastmath=True)
+def _saturation_pressure_scalar(temp_c):
+    """Scalar saturation_pressure for use inside compiled kernels (same linear extrapolation)."""
+    i = np.searchsorted(_temps_c, temp_c)
+    i = min(max(i, 1), len(_temps_c) - 1)
+    t0, t1 = _temps_c[i - 1], _temps_c[i]
+    p0, p1 = _sat_press_pa[i - 1], _sat_press_pa[i]
+    return p0 + (p1 - p0) * (temp_c - t0) / (t1 - t0)
+
+@njit(cache=True, fastmath=True)
+def _heat_loss_kernel(pool_temp, pool_area, T_day, T_night,
+                      wind_day, wind_night, rh_day, rh_night,
+                      night_hours, cover_used):
     """
-    Compute total heat loss in kWh/day based on detailed model with evaporation, radiation, and convection.
-    Returns Q_day and Q_night in kWh/day and breakdown of loss components.
+    Element-wise heat loss model over the climate arrays.
+    Returns the day/night totals and components in kWh/day as a tuple of arrays.
     """
-    seconds_per_hour = 3600
     hours_day = 24 - night_hours
 
     evap_fact = 0.7 #Evaporation tuning factor
@@ -33,57 +43,84 @@ def compute_heat_losses(pool_temp, pool_area, pool_depth, T_day, T_night,
     epsilon = 0.9  # emissivity
     sigma = 5.67e-8  # Stefan-Boltzmann constant W/m^2/K^4
 
-    # Sky temperature estimation (5°C below air temperature)
-    T_sky_day = T_day - 5
-    T_sky_night = T_night - 5
-
-    # Convert to Kelvin
+    # Pool-side terms are the same for every location
     T_pool_K = pool_temp + 273.15
-    T_sky_day_K = T_sky_day + 273.15
-    T_sky_night_K = T_sky_night + 273.15
-
-    # Evaporation heat loss (kW/m²)
-    Pw_day = saturation_pressure(pool_temp)
-    Pa_day = saturation_pressure(T_day) * rh_day / 100
-    q_evap_day = evap_fact*((30.6 + 32.1 * wind_day) * (Pw_day - Pa_day)) / (3600 * 133.322)
-
-    Pw_night = saturation_pressure(pool_temp)
-    Pa_night = saturation_pressure(T_night) * rh_night / 100
-    q_evap_night = evap_fact*((30.6 + 32.1 * wind_night) * (Pw_night - Pa_night)) / (3600 * 133.322)
-
-    # Radiation loss (W/m²) converted to kW/m²
-    q_rad_day = epsilon * sigma * (T_pool_K**4 - T_sky_day_K**4) / 1000
-    q_rad_night = epsilon * sigma * (T_pool_K**4 - T_sky_night_K**4) / 1000
-
-    # Convection loss using Ruiz and Martínez (2010) (kW/m²K)
-    h_conv_day = (3.1 + 4.1 * wind_day) / 1000
-    h_conv_night = (3.1 + 4.1 * wind_night) / 1000
-    q_conv_day = h_conv_day * (pool_temp - T_day)
-    q_conv_night = h_conv_night * (pool_temp - T_night)
-
-    # If pool cover is used at night, reduce evaporation and radiation losses by 70 %
-    if cover_used:
-        q_evap_night *= 0.3
-        q_rad_night *= 0.3
-
-    # Total per m²
-    q_total_day = q_evap_day + q_rad_day + q_conv_day
-    q_total_night = q_evap_night + q_rad_night + q_conv_night
-
-    # Total heat loss (kWh/day)
-    Q_day = q_total_day * pool_area * hours_day
-    Q_night = q_total_night * pool_area * night_hours
-
-    Q_day = np.maximum(Q_day, 0)
-    Q_night = np.maximum(Q_night, 0)
-
-    # Component heat losses (kWh/day)
-    evap_day = np.maximum(q_evap_day * pool_area * hours_day, 0)
-    evap_night = np.maximum(q_evap_night * pool_area * night_hours, 0)
-    rad_day = np.maximum(q_rad_day * pool_area * hours_day, 0)
-    rad_night = np.maximum(q_rad_night * pool_area * night_hours, 0)
-    conv_day = np.maximum(q_conv_day * pool_area * hours_day, 0)
-    conv_night = np.maximum(q_conv_night * pool_area * night_hours, 0)
+    Pw = _saturation_pressure_scalar(pool_temp)
+
+    Q_day = np.empty_like(T_day)
+    Q_night = np.empty_like(T_day)
+    evap_day = np.empty_like(T_day)
+    evap_night = np.empty_like(T_day)
+    rad_day = np.empty_like(T_day)
+    rad_night = np.empty_like(T_day)
+    conv_day = np.empty_like(T_day)
+    conv_night = np.empty_like(T_day)
+
+    for i in range(T_day.shape[0]):
+        # Sky temperature estimation (5°C below air temperature), in Kelvin
+        T_sky_day_K = T_day[i] - 5 + 273.15
+        T_sky_night_K = T_night[i] - 5 + 273.15
+
+        # Evaporation heat loss (kW/m²)
+        Pa_day = _saturation_pressure_scalar(T_day[i]) * rh_day[i] / 100
+        q_evap_day = evap_fact*((30.6 + 32.1 * wind_day[i]) * (Pw - Pa_day)) / (3600 * 133.322)
+
+        Pa_night = _saturation_pressure_scalar(T_night[i]) * rh_night[i] / 100
+        q_evap_night = evap_fact*((30.6 + 32.1 * wind_night[i]) * (Pw - Pa_night)) / (3600 * 133.322)
+
+        # Radiation loss (W/m²) converted to kW/m²
+        q_rad_day = epsilon * sigma * (T_pool_K**4 - T_sky_day_K**4) / 1000
+        q_rad_night = epsilon * sigma * (T_pool_K**4 - T_sky_night_K**4) / 1000
+
+        # Convection loss using Ruiz and Martínez (2010) (kW/m²K)
+        h_conv_day = (3.1 + 4.1 * wind_day[i]) / 1000
+        h_conv_night = (3.1 + 4.1 * wind_night[i]) / 1000
+        q_conv_day = h_conv_day * (pool_temp - T_day[i])
+        q_conv_night = h_conv_night * (pool_temp - T_night[i])
+
+        # If pool cover is used at night, reduce evaporation and radiation losses by 70 %
+        if cover_used:
+            q_evap_night *= 0.3
+            q_rad_night *= 0.3
+
+        # Total heat loss (kWh/day)
+        Q_day[i] = max((q_evap_day + q_rad_day + q_conv_day) * pool_area * hours_day, 0)
+        Q_night[i] = max((q_evap_night + q_rad_night + q_conv_night) * pool_area * night_hours, 0)
+
+        # Component heat losses (kWh/day)
+        evap_day[i] = max(q_evap_day * pool_area * hours_day, 0)
+        evap_night[i] = max(q_evap_night * pool_area * night_hours, 0)
+        rad_day[i] = max(q_rad_day * pool_area * hours_day, 0)
+        rad_night[i] = max(q_rad_night * pool_area * night_hours, 0)
+        conv_day[i] = max(q_conv_day * pool_area * hours_day, 0)
+        conv_night[i] = max(q_conv_night * pool_area * night_hours, 0)
+
+    return Q_day, Q_night, evap_day, evap_night, rad_day, rad_night, conv_day, conv_night
+
+def compute_heat_losses(pool_temp, pool_area, pool_depth, T_day, T_night,
+                        wind_day, wind_night, rh_day, rh_night,
+                        night_hours, cover_used):
+    """
+    Compute total heat loss in kWh/day based on detailed model with evaporation, radiation, and convection.
+    Returns Q_day and Q_night in kWh/day and breakdown of loss components.
+    """
+    seconds_per_hour = 3600
+    hours_day = 24 - night_hours
+
+    # Keep float32 climate arrays in float32; Python scalars (0-d float64 arrays here) give float64
+    inputs = [np.asarray(x) for x in (T_day, T_night, wind_day, wind_night, rh_day, rh_night)]
+    dtype = np.result_type(*inputs, np.float32)
+    climate = [np.ascontiguousarray(x) for x in
+               np.broadcast_arrays(*(np.atleast_1d(x.astype(dtype, copy=False)) for x in inputs))]
+    results = _heat_loss_kernel(
+        float(pool_temp), float(pool_area), *climate, float(night_hours), bool(cover_used)
+    )
+
+    # Scalar inputs give scalar results, as before the kernel
+    if all(x.ndim == 0 for x in inputs):
+        results = [r[0] for r in results]
+    (Q_day, Q_night, evap_day, evap_night,
+     rad_day, rad_night, conv_day, conv_night) = results
 
     return {
         "Q_day": Q_day,
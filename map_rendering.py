@@ -0,0 +1,109 @@
+import io
+import threading
+
+import numpy as np
+import matplotlib.pyplot as plt
+import cartopy.crs as ccrs
+import cartopy.feature as cfeature
+import streamlit as st
+from cartopy.feature import NaturalEarthFeature
+from matplotlib.figure import Figure
+from matplotlib.ticker import FormatStrFormatter
+
+from climate_data import interpolate_to_mesh, load_climate, load_mesh
+
+# High-resolution coastline for large display, created once when this module is imported
+_HIRES_COAST = NaturalEarthFeature(
+    'physical', 'coastline', '10m',
+    edgecolor='black', facecolor='none'
+)
+
+# Natural Earth shapefiles are downloaded on first use; maps drawn side by side must not fetch them at once
+_features_lock = threading.Lock()
+
+def _load_map_features(large):
+    with _features_lock:
+        coast = _HIRES_COAST if large else cfeature.COASTLINE.with_scale('110m')
+        for feature in (coast, cfeature.BORDERS):
+            tuple(feature.geometries())
+
+def plot_map(data, title, cmap, vmin=None, vmax=None, large=False):
+    _, _, polar_mask, _ = load_climate()
+    lon_mesh, lat_mesh, _ = load_mesh()
+    figsize = (12, 7) if large else (8, 5)
+
+    # Mask out Antarctica and Greenland for colorbar range
+    vmin = vmin if vmin is not None else np.nanmin(data[~polar_mask])
+    vmax = vmax if vmax is not None else np.nanmax(data[~polar_mask])
+
+    # Clip data to selected range
+    data_clipped = np.clip(data, vmin, vmax)
+    grid_clipped = interpolate_to_mesh(data_clipped)
+
+    # Figure rather than pyplot, whose global figure registry is not thread-safe
+    _load_map_features(large)
+    fig = Figure(figsize=figsize)
+    ax = fig.add_subplot(projection=ccrs.PlateCarree())
+    cf = ax.contourf(lon_mesh, lat_mesh, grid_clipped, levels=20, cmap=cmap, vmin=vmin, vmax=vmax)
+    cs = ax.contour(lon_mesh, lat_mesh, grid_clipped, levels=10, colors='black', linewidths=0.3)
+    ax.clabel(cs, inline=True, fontsize=8, fmt="%.0f")
+
+    if large:
+        ax.add_feature(_HIRES_COAST, linewidth=0.6)
+    else:
+        ax.coastlines()
+
+    ax.add_feature(cfeature.BORDERS, linestyle=':')
+    ax.set_title(title, fontsize=14 if large else 12)
+    cbar = fig.colorbar(cf, ax=ax, orientation='vertical', shrink=0.7)
+    cbar.ax.yaxis.set_major_formatter(FormatStrFormatter("%.0f"))
+
+    return fig
+
+# Mini helideck and collector sketch for the sidebar
+def plot_helideck_sidebar(diameter, collector_area, h_marking=True):
+    """Helideck outline with the collector area inside; h_marking adds the faint "H" and a translucent collector."""
+    fig, ax = plt.subplots(figsize=(2.5, 2.5), dpi=100)
+    fig.patch.set_alpha(0)  # Transparent background
+
+    helideck_radius = diameter / 2
+    collector_radius = np.sqrt(collector_area / np.pi)
+
+    # Draw collector (yellow filled circle)
+    collector = plt.Circle((0, 0), collector_radius, color='yellow', alpha=0.8 if h_marking else 1.0, label="Solar Collector")
+    ax.add_patch(collector)
+
+    # Draw helideck (black outline)
+    helideck = plt.Circle((0, 0), helideck_radius, color='black', fill=False, linewidth=2, label="Helideck")
+    ax.add_patch(helideck)
+
+    # Draw transparent "H" in center
+    if h_marking:
+        ax.text(0, 0, "H", color="black", fontsize=80, ha='center', va='center', alpha=0.2, weight='bold')
+
+    # Labels
+    ax.text(0, collector_radius * 0.0, "Solar\nCollector", color="black", fontsize=8, ha='center', va='center', weight='bold')
+    ax.text(0, helideck_radius * 1.05, "Helideck", color="black", fontsize=8, ha='center', va='bottom', weight='bold')
+
+    ax.set_xlim(-helideck_radius * 1.2, helideck_radius * 1.2)
+    ax.set_ylim(-helideck_radius * 1.2, helideck_radius * 1.2)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    return fig
+
+def figure_to_png(fig):
+    """Rasterise a figure to PNG bytes and close it, so only the bytes are kept or cached."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
+# Rendered once per sketch input and shown as a PNG; bounded since the keys are float sliders
+@st.cache_data(max_entries=64)
+def helideck_png(diameter, collector_area, h_marking=True):
+    return figure_to_png(plot_helideck_sidebar(diameter, collector_area, h_marking=h_marking))
+
+def render_map_png(data, title, cmap, vmin=None, vmax=None, large=False):
+    """Render plot_map to PNG bytes. Safe to call from several threads, as each map gets its own Figure."""
+    return figure_to_png(plot_map(data, title, cmap, vmin=vmin, vmax=vmax, large=large))
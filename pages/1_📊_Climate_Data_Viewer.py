@@ -1,20 +1,13 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.interpolate import griddata
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
+from climate_data import interpolate_to_mesh, load_climate, load_mesh, month_index, months_ordered
 
 st.set_page_config(page_title="Climate Data Viewer", layout="wide")
 st.title("📊 Climate Data Viewer")
 
-@st.cache_data
-def load_data():
-    return pd.read_csv("climate_data_sea.csv")
-
-df = load_data()
-
 # Parameter metadata
 parameter_info = {
     "ghi":    {"label": "Global Horizontal Irradiance", "unit": "kWh/m²/day"},
@@ -29,13 +22,11 @@ parameter_info = {
 available_metrics = list(parameter_info.keys())
 
 # Month logic
-months_ordered = [
-    "January", "February", "March", "April", "May", "June",
-    "July", "August", "September", "October", "November", "December"
-]
 full_to_short = {m: m[:3].lower() for m in months_ordered}
 short_to_full = {v: k for k, v in full_to_short.items()}
 
+df, metrics, _, _ = load_climate()
+
 available_months = [m for m in months_ordered if f"ghi_{m}" in df.columns]
 available_months_short = [full_to_short[m] for m in available_months]
 
@@ -80,25 +71,15 @@ else:
     if st.checkbox("Show Raw Data Table"):
         st.dataframe(df[["lat", "lon", column]])
 
-    lat = df["lat"].values
-    lon = df["lon"].values
-
-    # Apply GHI masking
-    ghi_cols = df.columns[df.columns.str.startswith("ghi_")]
-    mask = (df['lat'] < -65) | ((df['lat'] > 60) & (df['lon'].between(-60, -20)))
-    df.loc[mask, ghi_cols] *= 0.5
-
-    data = df[column].values
+    data = metrics[metric][:, month_index[month]]
 
     # Interpolation
-    lon_grid = np.linspace(min(lon), max(lon), 200)
-    lat_grid = np.linspace(min(lat), max(lat), 150)
-    lon_mesh, lat_mesh = np.meshgrid(lon_grid, lat_grid)
-    grid = griddata((lon, lat), data, (lon_mesh, lat_mesh), method='linear')
+    lon_mesh, lat_mesh, _ = load_mesh()
+    grid = interpolate_to_mesh(data)
 
     # Plotting
     fig, ax = plt.subplots(figsize=(10, 6), subplot_kw={'projection': ccrs.PlateCarree()})
-    cf = ax.contourf(lon_mesh, lat_mesh, grid, levels=100, cmap="viridis")
+    cf = ax.contourf(lon_mesh, lat_mesh, grid, levels=20, cmap="viridis")
 
     cs = ax.contour(lon_mesh, lat_mesh, grid, levels=10, colors='black', linewidths=0.5)
     ax.clabel(cs, inline=True, fontsize=8, fmt="%.1f")
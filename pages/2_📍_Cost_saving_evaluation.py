@@ -1,5 +1,7 @@
 
 from heat_loss_utils import compute_heat_losses
+from climate_data import load_climate, months_ordered
+from map_rendering import helideck_png
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -10,11 +12,6 @@ import matplotlib.pyplot as plt
 st.set_page_config(page_title="📍 Monthly Ship Location & Energy Savings", layout="wide")
 st.title("📍 Monthly Ship Location & Energy Savings")
 
-@st.cache_data
-def load_data():
-    return pd.read_csv("climate_data_sea.csv")
-
-df = load_data()
 
 # Sidebar input
 
@@ -34,34 +31,8 @@ collector_area = np.pi * (helideck_diameter / 2) ** 2 * collector_ratio
 st.sidebar.markdown(f"**Collector Area:** {collector_area:.1f} m²")
 
 # --- Mini helideck and collector visualization ---
-def plot_helideck_sidebar(diameter, collector_area):
-    fig, ax = plt.subplots(figsize=(2.5, 2.5), dpi=100)
-    fig.patch.set_alpha(0)  # Transparent background
-
-    helideck_radius = diameter / 2
-    collector_radius = np.sqrt(collector_area / np.pi)
-
-    # Draw collector (yellow filled circle)
-    collector = plt.Circle((0, 0), collector_radius, color='yellow', alpha=1.0, label="Solar Collector")
-    ax.add_patch(collector)
-
-    # Draw helideck (black outline)
-    helideck = plt.Circle((0, 0), helideck_radius, color='black', fill=False, linewidth=2, label="Helideck")
-    ax.add_patch(helideck)
-
-    # Labels
-    ax.text(0, 0, "Solar\nCollector", color="black", fontsize=8, ha='center', va='center', weight='bold')
-    ax.text(0, helideck_radius * 1.05, "Helideck", color="black", fontsize=8, ha='center', va='bottom', weight='bold')
-
-    ax.set_xlim(-helideck_radius * 1.2, helideck_radius * 1.2)
-    ax.set_ylim(-helideck_radius * 1.2, helideck_radius * 1.2)
-    ax.set_aspect('equal')
-    ax.axis('off')
-
-    return fig
-
 # Show in sidebar
-st.sidebar.pyplot(plot_helideck_sidebar(helideck_diameter, collector_area))
+st.sidebar.image(helideck_png(helideck_diameter, collector_area, h_marking=False))
 
 
 
@@ -91,12 +62,10 @@ shielding_factor = {
     "Highly shielded (5%) – partly enclosed": 0.05
 }[shielding]
 
-months_ordered = [
-    "January", "February", "March", "April", "May", "June",
-    "July", "August", "September", "October", "November", "December"
-]
 short_months = [m[:3].lower() for m in months_ordered]
 
+_, metrics, _, tree = load_climate()
+
 # Session state initialization
 if "coords_by_month" not in st.session_state:
     st.session_state.coords_by_month = {}
@@ -148,83 +117,77 @@ st.markdown("---")
 st.subheader("📊 Monthly Summary of Energy Use and Savings")
 
 if len(st.session_state.coords_by_month) == 12:
-    results = []
     days_in_month = {
         "January": 31, "February": 28, "March": 31, "April": 30, "May": 31, "June": 30,
         "July": 31, "August": 31, "September": 30, "October": 31, "November": 30, "December": 31
     }
     hours_day = 24 - night_hours
 
-    for month in months_ordered:
-        short = month[:3].lower()
-        lat_sel, lon_sel = st.session_state.coords_by_month[short]
-        df["dist"] = np.sqrt((df["lat"] - lat_sel)**2 + (df["lon"] - lon_sel)**2)
-        row = df.loc[df["dist"].idxmin()]
-
-        T_min = row[f"tmin_{month}"]
-        T_max = row[f"tmax_{month}"]
-        T_avg = row.get(f"tavg_{month}", (T_min + T_max)/2)
-        T_day = (T_avg + T_max) / 2
-        T_night = (T_avg + T_min) / 2
-        ghi = row[f"ghi_{month}"]
-        wind = row[f"ws10m_{month}"]
-        wind_day = wind * shielding_factor
-        wind_night = 0.8 * wind * shielding_factor
-        rh = row[f"rh_{month}"]
-        rh_day = rh
-        rh_night = 1.1 * rh
-
-        loss = compute_heat_losses(pool_temp, pool_area, pool_depth, T_day, T_night,
-                                   wind_day, wind_night, rh_day, rh_night, night_hours, cover_used)
-
-        Q_day = loss["Q_day"]
-        Q_night = loss["Q_night"]
-        total_loss = Q_day + Q_night
-        days = days_in_month[month]
-
-        helideck_gain = ghi * helideck_area * collector_efficiency
-        pool_solar_gain = ghi * pool_area * 0.7
-        net_pool_heating = max(total_loss - pool_solar_gain, 0)
-        net_saving = min(helideck_gain, net_pool_heating)
-
-        electrical_saving = net_saving / cop
-        diesel_kg = electrical_saving * 0.2
-        el_energy_requierd = net_pool_heating / cop
-        diesel_liters = diesel_kg / 0.84
-
-        results.append({
-            "Month": month,
-            "Lat": round(lat_sel, 2),
-            "Lon": round(lon_sel, 2),
-            "Heat Loss (kWh)": round(total_loss * days, 1),
-            "Pool direct solar heating (kWh)": round(pool_solar_gain * days, 1),
-            "Net heat requirement (kWh)": round(net_pool_heating * days, 1),        
-            "Electric heat requirement (kWh)": round(el_energy_requierd * days, 1),   
-            "Solar collector thermal savings (kWh)": round(net_saving * days, 1),
-            "Solar collector electric savings (kWh)": round(electrical_saving * days, 1),
-            "Diesel Saved (liters)": round(diesel_liters * days, 1),
-            "USD Saved": round(diesel_liters * usd_per_liter * days, 1),
-        })
-        
-    df_result = pd.DataFrame(results)
-    totals = df_result[[
-        "Heat Loss (kWh)", "Pool direct solar heating (kWh)", "Net heat requirement (kWh)",
-        "Electric heat requirement (kWh)", "Solar collector thermal savings (kWh)","Solar collector electric savings (kWh)","Diesel Saved (liters)","USD Saved"
-    ]].sum()
-
-    df_result.loc[len(df_result)] = {
-        "Month": "Total", "Lat": "-", "Lon": "-",
-        "Heat Loss (kWh)": round(totals["Heat Loss (kWh)"], 1),
-        "Pool direct solar heating (kWh)": round(totals["Pool direct solar heating (kWh)"], 1),
-        "Net heat requirement (kWh)": round(totals["Net heat requirement (kWh)"], 1),
-        "Electric heat requirement (kWh)": round(totals["Electric heat requirement (kWh)"], 1),
-        "Solar collector thermal savings (kWh)": round(totals["Solar collector thermal savings (kWh)"], 1),
-        "Solar collector electric savings (kWh)": round(totals["Solar collector electric savings (kWh)"], 1),
-        "Diesel Saved (liters)": round(totals["Diesel Saved (liters)"], 1),
-        "USD Saved": round(totals["USD Saved"], 1),
-    }
-
-    st.dataframe(df_result.set_index("Month"), use_container_width=True, height=(df_result.shape[0] + 1) * 35)
+    # Nearest grid point for all 12 months in one query
+    pts = np.array([st.session_state.coords_by_month[m[:3].lower()] for m in months_ordered])
+    _, idx = tree.query(pts, k=1)
+    month_range = np.arange(len(months_ordered), dtype=np.int32)
+
+    T_min = metrics["tmin"][idx, month_range]
+    T_max = metrics["tmax"][idx, month_range]
+    T_avg = metrics["tavg"][idx, month_range]
+    T_day = (T_avg + T_max) / 2
+    T_night = (T_avg + T_min) / 2
+    ghi = metrics["ghi_raw"][idx, month_range]
+    wind = metrics["ws10m"][idx, month_range]
+    wind_day = wind * shielding_factor
+    wind_night = 0.8 * wind * shielding_factor
+    rh = metrics["rh"][idx, month_range]
+    rh_day = rh
+    rh_night = 1.1 * rh
+
+    loss = compute_heat_losses(pool_temp, pool_area, pool_depth, T_day, T_night,
+                               wind_day, wind_night, rh_day, rh_night, night_hours, cover_used)
+
+    Q_day = loss["Q_day"]
+    Q_night = loss["Q_night"]
+    total_loss = Q_day + Q_night
+    days = np.array([days_in_month[month] for month in months_ordered], dtype=np.int32)
+
+    helideck_gain = ghi * helideck_area * collector_efficiency
+    pool_solar_gain = ghi * pool_area * 0.7
+    net_pool_heating = np.maximum(total_loss - pool_solar_gain, 0)
+    net_saving = np.minimum(helideck_gain, net_pool_heating)
+
+    electrical_saving = net_saving / cop
+    diesel_kg = electrical_saving * 0.2
+    el_energy_requierd = net_pool_heating / cop
+    diesel_liters = diesel_kg / 0.84
+
+    month_categories = months_ordered + ["Total"]
+    df_result = pd.DataFrame({
+        "Month": pd.Categorical(months_ordered, categories=month_categories, ordered=True),
+        "Lat": pts[:, 0].astype(np.float32).round(2),
+        "Lon": pts[:, 1].astype(np.float32).round(2),
+        "Heat Loss (kWh)": np.round(total_loss * days, 1),
+        "Pool direct solar heating (kWh)": np.round(pool_solar_gain * days, 1),
+        "Net heat requirement (kWh)": np.round(net_pool_heating * days, 1),
+        "Electric heat requirement (kWh)": np.round(el_energy_requierd * days, 1),
+        "Solar collector thermal savings (kWh)": np.round(net_saving * days, 1),
+        "Solar collector electric savings (kWh)": np.round(electrical_saving * days, 1),
+        "Diesel Saved (liters)": np.round(diesel_liters * days, 1),
+        "USD Saved": np.round(diesel_liters * usd_per_liter * days, 1),
+    })
+
+    totals = df_result.drop(columns=["Month", "Lat", "Lon"]).sum().round(1)
+    # NaN keeps Lat/Lon numeric; it is shown as "-" by the display formatter below
+    totals_row = pd.DataFrame({
+        "Month": pd.Categorical(["Total"], categories=month_categories, ordered=True),
+        "Lat": np.array([np.nan], dtype=np.float32),
+        "Lon": np.array([np.nan], dtype=np.float32),
+        **totals.to_dict(),
+    }, index=[0])
+    df_result = pd.concat([df_result, totals_row], ignore_index=True)
+
+    df_display = (df_result.set_index("Month").style
+                  .format(precision=1)
+                  .format("{:.2f}", subset=["Lat", "Lon"], na_rep="-"))
+    st.dataframe(df_display, use_container_width=True, height=(df_result.shape[0] + 1) * 35)
 
     # Plot: Monthly Energy
     fig1, ax1 = plt.subplots(figsize=(10, 4))
@@ -1,9 +1,9 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from heat_loss_utils import compute_heat_losses
-from scipy.interpolate import griddata
+from climate_data import interpolate_to_mesh, load_climate, load_mesh, month_index, months_ordered
+from map_rendering import helideck_png
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 
@@ -28,37 +28,8 @@ collector_area = np.pi * (helideck_diameter / 2) ** 2 * collector_ratio
 st.sidebar.markdown(f"**Collector Area:** {collector_area:.1f} m²")
 
 # --- Mini helideck and collector visualization ---
-def plot_helideck_sidebar(diameter, collector_area):
-    fig, ax = plt.subplots(figsize=(2.5, 2.5), dpi=100)
-    fig.patch.set_alpha(0)  # Transparent background
-
-    helideck_radius = diameter / 2
-    collector_radius = np.sqrt(collector_area / np.pi)
-
-    # Draw collector (yellow filled circle)
-    collector = plt.Circle((0, 0), collector_radius, color='yellow', alpha=0.8, label="Solar Collector")
-    ax.add_patch(collector)
-
-    # Draw helideck (black outline)
-    helideck = plt.Circle((0, 0), helideck_radius, color='black', fill=False, linewidth=2, label="Helideck")
-    ax.add_patch(helideck)
-
-    # Draw transparent "H" in center
-    ax.text(0, 0, "H", color="black", fontsize=80, ha='center', va='center', alpha=0.2, weight='bold')
-
-    # Labels
-    ax.text(0, collector_radius * 0.0, "Solar\nCollector", color="black", fontsize=8, ha='center', va='center', weight='bold')
-    ax.text(0, helideck_radius * 1.05, "Helideck", color="black", fontsize=8, ha='center', va='bottom', weight='bold')
-
-    ax.set_xlim(-helideck_radius * 1.2, helideck_radius * 1.2)
-    ax.set_ylim(-helideck_radius * 1.2, helideck_radius * 1.2)
-    ax.set_aspect('equal')
-    ax.axis('off')
-
-    return fig
-
 # Show in sidebar
-st.sidebar.pyplot(plot_helideck_sidebar(helideck_diameter, collector_area))
+st.sidebar.image(helideck_png(helideck_diameter, collector_area))
 
 
 
@@ -87,38 +58,22 @@ shielding_factor = {
     "Highly shielded (5%) – Partly enclosed": 0.05
 }[shielding]
 
-month = st.sidebar.selectbox("Select Month", [
-    "January", "February", "March", "April", "May", "June",
-    "July", "August", "September", "October", "November", "December"
-])
-# --- Load climate data ---
-@st.cache_data
-def load_data():
-    return pd.read_csv("climate_data_sea.csv")
-
-df = load_data()
-lat = df["lat"].values
-lon = df["lon"].values
-
-ghi_cols = df.columns[df.columns.str.startswith("ghi_")]
-mask = (df['lat'] < -65) | ((df['lat'] > 60) & (df['lon'].between(-60, -20)))
-df.loc[mask, ghi_cols] *= 0.5
+month = st.sidebar.selectbox("Select Month", months_ordered)
+month_idx = month_index[month]
 
-# Clean polar outliers
-ghi_cols = df.columns[df.columns.str.startswith("ghi_")]
-mask = (df['lat'] < -65) | ((df['lat'] > 60) & (df['lon'].between(-60, -20)))
-df.loc[mask, ghi_cols] *= 0.5
+# --- Load climate data ---
+_, metrics, polar_mask, _ = load_climate()
 
 # Climate values
-tmin = df[f"tmin_{month}"].values
-tmax = df[f"tmax_{month}"].values
-tavg = df.get(f"tavg_{month}", (tmin + tmax) / 2).values
+tmin = metrics["tmin"][:, month_idx]
+tmax = metrics["tmax"][:, month_idx]
+tavg = metrics["tavg"][:, month_idx]
 T_day = (tavg + tmax) / 2
 T_night = (tavg + tmin) / 2
-wind = df[f"ws10m_{month}"].values
+wind = metrics["ws10m"][:, month_idx]
 wind_day = wind * shielding_factor
 wind_night = 0.8 * wind * shielding_factor
-rh = df[f"rh_{month}"].values
+rh = metrics["rh"][:, month_idx]
 rh_day = rh
 rh_night = 1.1 * rh
 
@@ -135,18 +90,15 @@ total_loss = loss["Q_day"] + loss["Q_night"]
 
 
 # --- Plot function ---
-def plot_loss_map(data, title, cmap, lon, lat):
+def plot_loss_map(data, title, cmap):
     # Create interpolation grid
-    lon_grid = np.linspace(min(lon), max(lon), 200)
-    lat_grid = np.linspace(min(lat), max(lat), 150)
-    lon_mesh, lat_mesh = np.meshgrid(lon_grid, lat_grid)
+    lon_mesh, lat_mesh, _ = load_mesh()
 
     # Interpolate to grid
-    grid = griddata((lon, lat), data, (lon_mesh, lat_mesh), method='linear')
+    grid = interpolate_to_mesh(data)
 
     # Compute vmin and vmax for colorbar, excluding Antarctica and Greenland
-    mask = (lat > -65) & ~((lat > 60) & (lon > -60) & (lon < -20))
-    capped_max = np.nanpercentile(data[mask], 99)  # e.g. 99th percentile
+    capped_max = np.nanpercentile(data[~polar_mask], 99)  # e.g. 99th percentile
     capped_min = 0
 
     # --- PLOT ---
@@ -156,7 +108,7 @@ def plot_loss_map(data, title, cmap, lon, lat):
     cf = ax.contourf(
         lon_mesh, lat_mesh,
         np.clip(grid, capped_min, capped_max),  # clip for color scale only
-        levels=100, cmap=cmap, vmin=capped_min, vmax=capped_max
+        levels=20, cmap=cmap, vmin=capped_min, vmax=capped_max
     )
 
     # Add contours (can use unclipped grid here)
@@ -176,8 +128,8 @@ def plot_loss_map(data, title, cmap, lon, lat):
 # --- Show plots ---
 col1, col2 = st.columns(2)
 with col1:
-    st.pyplot(plot_loss_map(rad_loss, "Radiation Loss per Day", "jet",lon,lat))
-    st.pyplot(plot_loss_map(evap_loss, "Evaporation Loss per Day", "jet",lon,lat))
+    st.pyplot(plot_loss_map(rad_loss, "Radiation Loss per Day", "jet"))
+    st.pyplot(plot_loss_map(evap_loss, "Evaporation Loss per Day", "jet"))
 with col2:
-    st.pyplot(plot_loss_map(conv_loss, "Convection Loss per Day", "jet",lon,lat))
-    st.pyplot(plot_loss_map(total_loss, "Total Heat Loss per Day", "jet",lon,lat))
+    st.pyplot(plot_loss_map(conv_loss, "Convection Loss per Day", "jet"))
+    st.pyplot(plot_loss_map(total_loss, "Total Heat Loss per Day", "jet"))